@@ -6,7 +6,18 @@ __version__ = "1.0.2"
 __author__ = "Nodie Team"
 __email__ = "support@nodie.host"
 
-from nodie_cli.client import NodieClient
-from nodie_cli.node import NodieNode
-
 __all__ = ["NodieClient", "NodieNode", "__version__"]
+
+
+def __getattr__(name):
+    # Resolved lazily so that importing the package for __version__ (as the
+    # CLI does on every invocation) doesn't pull in requests and psutil.
+    if name == "NodieClient":
+        from nodie_cli.client import NodieClient
+
+        return NodieClient
+    if name == "NodieNode":
+        from nodie_cli.node import NodieNode
+
+        return NodieNode
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,31 +10,74 @@ import keyring
 SERVICE_NAME = "nodie-cli"
 USERNAME_KEY = "nodie_user"
 
+# Credentials are stored as "email<US>token<US>user_id" using the ASCII unit
+# separator, which cannot appear in any of the fields.
+_FIELD_SEP = "\x1f"
+
+# Keyring lookups are an IPC round-trip to the OS credential store, so the
+# result is kept for the lifetime of the process.
+_cached_creds: Optional[dict] = None
+_cached_valid: bool = False
+
+
+def _invalidate_cache() -> None:
+    """Forget the cached credentials so the next read hits the keyring."""
+    global _cached_creds, _cached_valid
+    _cached_valid = False
+    _cached_creds = None
+
 
 def save_credentials(email: str, token: str, user_id: str) -> None:
     """Save credentials securely using system keyring."""
+    global _cached_creds, _cached_valid
+    keyring.set_password(
+        SERVICE_NAME,
+        USERNAME_KEY,
+        f"{email}{_FIELD_SEP}{token}{_FIELD_SEP}{user_id or ''}",
+    )
     credentials = {
         "email": email,
         "token": token,
         "user_id": user_id,
     }
-    keyring.set_password(SERVICE_NAME, USERNAME_KEY, json.dumps(credentials))
+    
+    # We already hold what was written, so there's no need to read it back.
+    _cached_creds = credentials
+    _cached_valid = True
 
 
 def get_credentials() -> Optional[dict]:
     """Get saved credentials from system keyring."""
+    global _cached_creds, _cached_valid
+    if _cached_valid:
+        return _cached_creds
+    
+    creds = None
     try:
         data = keyring.get_password(SERVICE_NAME, USERNAME_KEY)
-        if data:
-            return json.loads(data)
+        if data and _FIELD_SEP not in data:
+            # Entries written by older versions are JSON. Go by the separator
+            # rather than a leading "{", which is valid in an email address.
+            creds = json.loads(data)
+        elif data:
+            email, token, user_id = data.split(_FIELD_SEP, 2)
+            creds = {"email": email, "token": token, "user_id": user_id or None}
     except Exception:
         pass
-    return None
+    
+    _cached_creds = creds
+    _cached_valid = True
+    return creds
+
+
+def get_auth_state() -> Optional[dict]:
+    """Get the saved credentials, reading the keyring at most once per process."""
+    return _cached_creds if _cached_valid else get_credentials()
 
 
 def get_token() -> Optional[str]:
     """Get the saved authentication token."""
-    creds = get_credentials()
+    creds = get_auth_state()
     if creds:
         return creds.get("token")
     return None
@@ -42,7 +85,7 @@ def get_token() -> Optional[str]:
 
 def get_user_info() -> Optional[Tuple[str, str]]:
     """Get saved user email and ID."""
-    creds = get_credentials()
+    creds = get_auth_state()
     if creds:
         return creds.get("email"), creds.get("user_id")
     return None, None
@@ -54,3 +97,4 @@ def clear_credentials() -> None:
         keyring.delete_password(SERVICE_NAME, USERNAME_KEY)
     except keyring.errors.PasswordDeleteError:
         pass
+    _invalidate_cache()
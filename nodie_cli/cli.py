@@ -2,54 +2,95 @@
 Nodie CLI - Main command line interface.
 """
 
+import math
 import os
+import re
 import signal
 import sys
 import time
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from nodie_cli import __version__
-from nodie_cli.auth import clear_credentials, get_credentials, get_token, save_credentials
-from nodie_cli.client import APIError, NodieClient
-from nodie_cli.config import get_config_dir, load_config, save_config
-from nodie_cli.node import NodieNode
 
-console = Console()
+# rich, requests, keyring and psutil are imported inside the commands that use
+# them so that `nodie --help` and `nodie --version` start quickly.
+_console = None
 
 
-def print_banner():
-    """Print the Nodie banner."""
-    banner = """
+def get_console():
+    """Get the shared rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        
+        _console = Console()
+    return _console
+
+
+_BANNER_MARKUP = """
 [cyan]╔═╗╔═╗╔═╗═══════════════════════════════════╗
 ║ ║║ ║║ ║  [bold white]NODIE CLI[/bold white]                        ║
 ║ ╚╝ ║║ ║  [dim]Turn your terminal into a node[/dim]      ║
 ║    ║╚═╝  [dim]Earn rewards for sharing bandwidth[/dim] ║
 ╚════╝═════════════════════════════════════════╝[/cyan]
 """
-    console.print(banner)
+_banner = None
+
+
+def print_banner():
+    """Print the Nodie banner."""
+    global _banner
+    if _banner is None:
+        from rich.text import Text
+        
+        _banner = Text.from_markup(_BANNER_MARKUP)
+    get_console().print(_banner)
+
+
+def make_details_table(value_style: Optional[str] = None):
+    """Create an unframed two-column table of dimmed labels and values."""
+    from rich.table import Table
+    
+    table = Table(show_header=False, box=None)
+    table.add_column("Key", style="dim")
+    table.add_column("Value", style=value_style)
+    return table
+
+
+def get_client(ctx: click.Context):
+    """Get the API client shared by this invocation, creating it on first use."""
+    ctx.ensure_object(dict)
+    client = ctx.obj.get("client")
+    if client is None:
+        from nodie_cli.auth import get_auth_state
+        from nodie_cli.client import NodieClient
+        
+        creds = get_auth_state()
+        client = ctx.obj["client"] = NodieClient(creds.get("token") if creds else None)
+    return client
 
 
 @click.group()
 @click.version_option(version=__version__, prog_name="nodie")
-def main():
+@click.pass_context
+def main(ctx: click.Context):
     """Nodie CLI - Turn your terminal into a network node."""
-    pass
+    ctx.ensure_object(dict)
 
 
 @main.command()
 def login():
     """Login to your Nodie account."""
+    from nodie_cli.auth import get_auth_state, save_credentials
+    from nodie_cli.client import APIError, NodieClient
+    
+    console = get_console()
     print_banner()
     
     # Check if already logged in
-    creds = get_credentials()
+    creds = get_auth_state()
     if creds:
         console.print(f"[yellow]Already logged in as {creds.get('email')}[/yellow]")
         if not click.confirm("Do you want to login with a different account?"):
@@ -60,6 +101,8 @@ def login():
     email = click.prompt("Email")
     password = click.prompt("Password", hide_input=True)
     
+    # Not the shared client: that one may carry the token of the account
+    # being switched away from
     client = NodieClient()
     
     with console.status("[bold cyan]Logging in...[/bold cyan]"):
@@ -86,31 +129,44 @@ def login():
 @main.command()
 def logout():
     """Logout and clear saved credentials."""
+    from nodie_cli.auth import clear_credentials
+    
+    console = get_console()
     clear_credentials()
     console.print("[green]✓ Logged out successfully[/green]")
 
 
 @main.command()
 @click.option("--foreground", "-f", is_flag=True, help="Run in foreground (don't daemonize)")
-def start(foreground: bool):
+@click.pass_context
+def start(ctx: click.Context, foreground: bool):
     """Start the node and begin earning."""
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    from nodie_cli.auth import get_auth_state
+    from nodie_cli.client import APIError
+    from nodie_cli.node import NodieNode
+    
+    console = get_console()
     print_banner()
     
     # Check credentials
-    token = get_token()
+    creds = get_auth_state()
+    token = creds.get("token") if creds else None
     if not token:
         console.print("[red]✗ Not logged in. Run 'nodie login' first.[/red]")
         sys.exit(1)
     
     # Check if already running
-    if NodieNode.is_node_running():
-        pid = NodieNode.get_running_pid()
+    pid = NodieNode.get_running_pid()
+    if pid is not None:
         console.print(f"[yellow]Node is already running (PID: {pid})[/yellow]")
         console.print("Run 'nodie stop' to stop it first.")
         sys.exit(1)
     
-    client = NodieClient(token)
-    node = NodieNode(client)
+    node = NodieNode(get_client(ctx))
     
     # Set up signal handlers
     def handle_signal(signum, frame):
@@ -142,9 +198,7 @@ def start(foreground: bool):
     # Display node info
     console.print("[green]✓ Node started successfully![/green]\n")
     
-    info_table = Table(show_header=False, box=None)
-    info_table.add_column("Key", style="dim")
-    info_table.add_column("Value")
+    info_table = make_details_table()
     info_table.add_row("Node ID", node_info.get("nodeId", "")[:12] + "...")
     info_table.add_row("Device ID", node_info.get("deviceId", "")[:12] + "...")
     info_table.add_row("IP Address", node_info.get("ip", "Unknown"))
@@ -168,32 +222,57 @@ def start(foreground: bool):
         node._on_stats_update = on_stats_update
         node._on_error = on_error
         
+        def make_stats_table():
+            stats_table = make_details_table("cyan")
+            
+            uptime = node.stats["uptime_seconds"]
+            hours, remainder = divmod(uptime, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            
+            stats_table.add_row("Uptime", f"{int(hours)}h {int(minutes)}m {int(seconds)}s")
+            stats_table.add_row("Points Earned", f"{node.stats['points_earned']:.4f}")
+            stats_table.add_row("Heartbeats", str(node.stats["heartbeats_sent"]))
+            stats_table.add_row("Connection", node.node_info.get("connectionQuality", "unknown").upper())
+            stats_table.add_row("Speed", f"{node.node_info.get('speedMbps', 0):.1f} Mbps")
+            return stats_table
+        
+        def make_stats_panel():
+            return Panel(make_stats_table(), title="[green]● Node Running[/green]", border_style="green")
+        
+        # From here on a signal interrupts the render loop's sleep straight
+        # away, and the loop stops the node itself on the way out.
+        def request_stop(signum, frame):
+            raise KeyboardInterrupt
+        
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+        
+        # Live only rewrites the lines that changed, so there is no need to
+        # clear the screen and redraw the banner on every tick. Every value in
+        # the table is updated by the heartbeat thread alongside the heartbeat
+        # counter, so the table is only rebuilt when that counter moves.
         try:
-            while node.is_running:
-                # Create stats table
-                stats_table = Table(show_header=False, box=None)
-                stats_table.add_column("Key", style="dim")
-                stats_table.add_column("Value", style="cyan")
-                
-                uptime = node.stats["uptime_seconds"]
-                hours, remainder = divmod(uptime, 3600)
-                minutes, seconds = divmod(remainder, 60)
-                
-                stats_table.add_row("Uptime", f"{int(hours)}h {int(minutes)}m {int(seconds)}s")
-                stats_table.add_row("Points Earned", f"{node.stats['points_earned']:.4f}")
-                stats_table.add_row("Heartbeats", str(node.stats["heartbeats_sent"]))
-                stats_table.add_row("Connection", node.node_info.get("connectionQuality", "unknown").upper())
-                stats_table.add_row("Speed", f"{node.node_info.get('speedMbps', 0):.1f} Mbps")
-                
-                console.clear()
-                print_banner()
-                console.print(Panel(stats_table, title="[green]● Node Running[/green]", border_style="green"))
-                console.print("\n[dim]Press Ctrl+C to stop[/dim]")
-                
-                time.sleep(5)
+            with Live(
+                make_stats_panel(),
+                console=console,
+                auto_refresh=False,
+                screen=False,
+            ) as live:
+                last_heartbeats = node.stats["heartbeats_sent"]
+                while node.is_running:
+                    time.sleep(5)
+                    heartbeats = node.stats["heartbeats_sent"]
+                    if heartbeats == last_heartbeats:
+                        continue
+                    last_heartbeats = heartbeats
+                    live.update(make_stats_panel(), refresh=True)
         except KeyboardInterrupt:
-            pass
+            console.print("\n[yellow]Stopping node...[/yellow]")
         
+        # Ignore further signals while stopping, so a second Ctrl+C can't
+        # skip notifying the server and removing the PID file.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
         node.stop()
         console.print("\n[green]✓ Node stopped[/green]")
     else:
@@ -205,39 +284,48 @@ def start(foreground: bool):
 @main.command()
 def stop():
     """Stop the running node."""
-    if not NodieNode.is_node_running():
+    from nodie_cli.node import NodieNode
+    
+    console = get_console()
+    pid = NodieNode.get_running_pid()
+    if pid is None:
         console.print("[yellow]No node is currently running.[/yellow]")
         return
     
-    pid = NodieNode.get_running_pid()
-    if pid:
-        try:
-            os.kill(pid, signal.SIGTERM)
-            console.print(f"[green]✓ Sent stop signal to node (PID: {pid})[/green]")
-        except ProcessLookupError:
-            console.print("[yellow]Node process not found.[/yellow]")
-        except PermissionError:
-            console.print("[red]Permission denied. Try with sudo.[/red]")
+    try:
+        os.kill(pid, signal.SIGTERM)
+        console.print(f"[green]✓ Sent stop signal to node (PID: {pid})[/green]")
+    except ProcessLookupError:
+        console.print("[yellow]Node process not found.[/yellow]")
+    except PermissionError:
+        console.print("[red]Permission denied. Try with sudo.[/red]")
 
 
 @main.command()
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed information")
-def status(verbose: bool):
+@click.pass_context
+def status(ctx: click.Context, verbose: bool):
     """Check if node is running."""
+    from nodie_cli.node import NodieNode
+    
+    console = get_console()
     print_banner()
     
-    is_running = NodieNode.is_node_running()
     pid = NodieNode.get_running_pid()
     
-    if is_running:
+    if pid is not None:
         console.print(f"[green]● Node is running[/green] (PID: {pid})")
     else:
         console.print("[red]● Node is not running[/red]")
     
     if verbose:
-        token = get_token()
+        from nodie_cli.auth import get_auth_state
+        from nodie_cli.client import APIError
+        
+        creds = get_auth_state()
+        token = creds.get("token") if creds else None
         if token:
-            client = NodieClient(token)
+            client = get_client(ctx)
             try:
                 user = client.get_me()
                 console.print(f"\n[bold]Account:[/bold] {user.get('email')}")
@@ -247,16 +335,24 @@ def status(verbose: bool):
 
 
 @main.command()
-def stats():
+@click.pass_context
+def stats(ctx: click.Context):
     """View your earnings and statistics."""
+    from rich.table import Table
+    
+    from nodie_cli.auth import get_auth_state
+    from nodie_cli.client import APIError
+    
+    console = get_console()
     print_banner()
     
-    token = get_token()
+    creds = get_auth_state()
+    token = creds.get("token") if creds else None
     if not token:
         console.print("[red]✗ Not logged in. Run 'nodie login' first.[/red]")
         sys.exit(1)
     
-    client = NodieClient(token)
+    client = get_client(ctx)
     
     with console.status("[bold cyan]Fetching stats...[/bold cyan]"):
         try:
@@ -306,10 +402,18 @@ def stats():
 @main.command()
 def speedtest():
     """Run a network speed test."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    from nodie_cli.client import NodieClient
+    from nodie_cli.node import NodieNode
+    
+    console = get_console()
     print_banner()
     
     console.print("[bold]Running speed test...[/bold]\n")
     
+    # The speed test never calls the API, so don't touch the keyring
     node = NodieNode(NodieClient())
     
     with Progress(
@@ -322,9 +426,7 @@ def speedtest():
         progress.remove_task(task)
     
     # Results
-    results_table = Table(show_header=False, box=None)
-    results_table.add_column("Metric", style="dim")
-    results_table.add_column("Value", style="cyan")
+    results_table = make_details_table("cyan")
     
     results_table.add_row("Download Speed", f"{speed_mbps:.2f} Mbps")
     results_table.add_row("Latency", f"{latency_ms:.0f} ms")
@@ -343,24 +445,44 @@ def speedtest():
     console.print(Panel(results_table, title="Speed Test Results", border_style="cyan"))
 
 
+_BOOL_VALUES = {"true": True, "false": False}
+
+# Plain decimal numbers only: int() and float() would also accept "1_000",
+# "nan" and "inf", and the last two can't be written to JSON.
+_INT_RE = re.compile(r"[+-]?[0-9]+")
+_FLOAT_RE = re.compile(r"[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?")
+
+
+def coerce_config_value(value: str):
+    """Convert a value given on the command line to a bool, int or float if it is one."""
+    lowered = value.lower()
+    if lowered in _BOOL_VALUES:
+        return _BOOL_VALUES[lowered]
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _FLOAT_RE.fullmatch(value):
+        number = float(value)
+        if math.isfinite(number):
+            return number
+    return value
+
+
 @main.command()
 @click.option("--set", "set_value", nargs=2, help="Set a config value (key value)")
 def config(set_value):
     """View or update configuration."""
+    from rich.table import Table
+    
+    from nodie_cli.config import get_config_dir, load_config, save_config
+    
+    console = get_console()
     print_banner()
     
     if set_value:
         key, value = set_value
         cfg = load_config()
         
-        # Try to convert to appropriate type
-        if value.lower() == "true":
-            value = True
-        elif value.lower() == "false":
-            value = False
-        elif value.isdigit():
-            value = int(value)
-        
+        value = coerce_config_value(value)
         cfg[key] = value
         save_config(cfg)
         console.print(f"[green]✓ Set {key} = {value}[/green]")
@@ -382,10 +504,11 @@ def config(set_value):
 @click.option("--user", "user_level", is_flag=True, help="Install for current user only (macOS)")
 def install_service(user_level: bool):
     """Install Nodie as a system service."""
-    print_banner()
-    
     from nodie_cli.service import install_service as do_install
     
+    console = get_console()
+    print_banner()
+    
     console.print("[bold]Installing Nodie service...[/bold]\n")
     success = do_install(user_level)
     
@@ -398,6 +521,7 @@ def uninstall_service():
     """Uninstall the system service."""
     from nodie_cli.service import uninstall_service as do_uninstall
     
+    console = get_console()
     console.print("[bold]Uninstalling Nodie service...[/bold]\n")
     success = do_uninstall()
     
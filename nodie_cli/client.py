@@ -2,16 +2,28 @@
 HTTP client for Nodie API.
 """
 
+import json
 import platform
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from nodie_cli import __version__
 from nodie_cli.config import get_config_value
 
 
+class HeartbeatResult(NamedTuple):
+    """Server response to a heartbeat."""
+    
+    points_earned: float = 0.0
+    network_score: int = 30
+    ip_type: str = "unknown"
+    connection_quality: str = "unknown"
+
+
 class NodieClient:
     """HTTP client for communicating with the Nodie API."""
     
@@ -19,6 +31,21 @@ class NodieClient:
         self.base_url = get_config_value("api_url", "https://nodie.host/api")
         self.token = token
         self.session = requests.Session()
+        # Keep connections to the API alive across heartbeats and retry
+        # idempotent requests on transient gateway errors. Read errors are
+        # not retried, so a hung API fails after one read timeout rather
+        # than several.
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        ))
         self.session.headers.update({
             "Content-Type": "application/json",
             "User-Agent": f"nodie-cli/{__version__} ({platform.system()})",
@@ -47,27 +74,32 @@ class NodieClient:
                 url=url,
                 json=data,
                 params=params,
-                timeout=30,
+                timeout=(3.0, 30),
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            if e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    raise APIError(
-                        error_data.get("detail", str(e)),
-                        status_code=e.response.status_code,
-                    )
-                except ValueError:
-                    pass
-            raise APIError(str(e))
         except requests.exceptions.ConnectionError:
             raise APIError("Connection failed. Check your internet connection.")
         except requests.exceptions.Timeout:
             raise APIError("Request timed out. Please try again.")
         except requests.exceptions.RequestException as e:
             raise APIError(f"Request failed: {e}")
+        
+        # Check the status directly rather than via raise_for_status(), and
+        # parse the body at most once on either path.
+        if response.ok:
+            try:
+                return json.loads(response.content)
+            except ValueError as e:
+                raise APIError(f"Request failed: invalid JSON response ({e})") from e
+        
+        message = f"{response.status_code} Error: {response.reason} for url: {response.url}"
+        if "json" in response.headers.get("Content-Type", ""):
+            try:
+                error_data = json.loads(response.content)
+            except ValueError:
+                error_data = None
+            if isinstance(error_data, dict):
+                message = error_data.get("detail", message)
+        raise APIError(message, status_code=response.status_code)
     
     def login(self, email: str, password: str) -> Dict[str, Any]:
         """Login and get authentication token."""
@@ -97,9 +129,9 @@ class NodieClient:
         ip: Optional[str] = None,
         speed_mbps: Optional[float] = None,
         latency_ms: Optional[float] = None,
-    ) -> Dict[str, Any]:
+    ) -> HeartbeatResult:
         """Send heartbeat to server."""
-        return self._request("POST", "/node/heartbeat", data={
+        result = self._request("POST", "/node/heartbeat", data={
             "nodeId": node_id,
             "bandwidthUsed": bandwidth_used,
             "cpuUsage": cpu_usage,
@@ -108,6 +140,12 @@ class NodieClient:
             "speedMbps": speed_mbps,
             "latencyMs": latency_ms,
         })
+        return HeartbeatResult(
+            points_earned=result.get("pointsEarned", 0.0),
+            network_score=result.get("networkScore", 30),
+            ip_type=result.get("ipType", "unknown"),
+            connection_quality=result.get("connectionQuality", "unknown"),
+        )
     
     def stop_node(self, node_id: str) -> Dict[str, Any]:
         """Stop a node."""
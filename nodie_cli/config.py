@@ -5,7 +5,8 @@ Configuration management for Nodie CLI.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import appdirs
 
@@ -21,70 +22,137 @@ DEFAULT_CONFIG = {
     "log_level": "INFO",
 }
 
+# Config keys that can be overridden from the environment
+_ENV_OVERRIDES = (
+    ("api_url", "NODIE_API_URL"),
+    ("log_level", "NODIE_LOG_LEVEL"),
+)
 
-def get_config_dir() -> Path:
-    """Get the configuration directory path."""
+# Resolved config directory, config file and PID file paths, keyed by the
+# NODIE_CONFIG_DIR they were computed from, and the last directory we made
+# sure exists
+_config_paths: Optional[Tuple[Optional[str], Path, Path, Path]] = None
+_created_config_dir: Optional[Path] = None
+
+# Parsed configuration, reused until the config file's path or mtime, or one
+# of the environment overrides, changes
+_config_cache: Optional[Mapping[str, Any]] = None
+_config_key: Optional[Tuple[Path, Optional[int], Tuple[Optional[str], ...]]] = None
+
+
+def _resolve_paths() -> Tuple[Optional[str], Path, Path, Path]:
+    """Get the config directory, config file and PID file paths."""
+    global _config_paths
     env_dir = os.environ.get("NODIE_CONFIG_DIR")
-    if env_dir:
-        config_dir = Path(env_dir)
-    else:
-        config_dir = Path(appdirs.user_config_dir(APP_NAME, APP_AUTHOR))
-    
-    config_dir.mkdir(parents=True, exist_ok=True)
+    if _config_paths is None or _config_paths[0] != env_dir:
+        if env_dir:
+            config_dir = Path(env_dir)
+        else:
+            config_dir = Path(appdirs.user_config_dir(APP_NAME, APP_AUTHOR))
+        _config_paths = (env_dir, config_dir, config_dir / "config.json", config_dir / "nodie.pid")
+    return _config_paths
+
+
+def _compute_config_dir() -> Path:
+    """Get the configuration directory path without touching the filesystem."""
+    return _resolve_paths()[1]
+
+
+def ensure_config_dir() -> Path:
+    """Get the configuration directory path, creating it if needed."""
+    global _created_config_dir
+    config_dir = _compute_config_dir()
+    if config_dir != _created_config_dir:
+        config_dir.mkdir(parents=True, exist_ok=True)
+        _created_config_dir = config_dir
     return config_dir
 
 
+def get_config_dir() -> Path:
+    """Get the configuration directory path."""
+    return ensure_config_dir()
+
+
 def get_config_file() -> Path:
     """Get the configuration file path."""
-    return get_config_dir() / "config.json"
+    return _resolve_paths()[2]
 
 
 def get_pid_file() -> Path:
     """Get the PID file path."""
-    return get_config_dir() / "nodie.pid"
+    return _resolve_paths()[3]
 
 
 def get_log_file() -> Path:
     """Get the log file path."""
-    log_dir = get_config_dir() / "logs"
+    log_dir = ensure_config_dir() / "logs"
     log_dir.mkdir(exist_ok=True)
     return log_dir / "nodie.log"
 
 
-def load_config() -> Dict[str, Any]:
-    """Load configuration from file."""
-    config_file = get_config_file()
-    config = DEFAULT_CONFIG.copy()
+def _stat_config(config_file: Path) -> Tuple[Path, Optional[int], Tuple[Optional[str], ...]]:
+    """Get the cache key for a config file: path, mtime and environment overrides."""
+    env_values = tuple(os.environ.get(env_var) for _, env_var in _ENV_OVERRIDES)
+    try:
+        return config_file, config_file.stat().st_mtime_ns, env_values
+    except OSError:
+        return config_file, None, env_values
+
+
+def _build_config(file_config: Dict[str, Any]) -> Mapping[str, Any]:
+    """Merge defaults, environment overrides and file values."""
+    env_config = {}
+    for key, env_var in _ENV_OVERRIDES:
+        value = os.environ.get(env_var)
+        if value:
+            env_config[key] = value
     
-    # Override with environment variables
-    if os.environ.get("NODIE_API_URL"):
-        config["api_url"] = os.environ["NODIE_API_URL"]
-    if os.environ.get("NODIE_LOG_LEVEL"):
-        config["log_level"] = os.environ["NODIE_LOG_LEVEL"]
+    # Read-only, since get_config_value() hands out values without copying
+    return MappingProxyType({**DEFAULT_CONFIG, **env_config, **file_config})
+
+
+def _load_cached_config() -> Mapping[str, Any]:
+    """Load configuration, reparsing the file only when it has changed."""
+    global _config_cache, _config_key
+    config_file = get_config_file()
+    stamp = _stat_config(config_file)
+    if _config_cache is not None and stamp == _config_key:
+        return _config_cache
     
     # Load from file
-    if config_file.exists():
+    file_config = {}
+    if stamp[1] is not None:
         try:
             with open(config_file, "r") as f:
                 file_config = json.load(f)
-                config.update(file_config)
         except (json.JSONDecodeError, IOError):
             pass
     
-    return config
+    _config_cache = _build_config(file_config)
+    _config_key = stamp
+    return _config_cache
+
+
+def load_config() -> Dict[str, Any]:
+    """Load configuration from file."""
+    return dict(_load_cached_config())
 
 
 def save_config(config: Dict[str, Any]) -> None:
     """Save configuration to file."""
+    global _config_cache, _config_key
+    ensure_config_dir()
     config_file = get_config_file()
     with open(config_file, "w") as f:
         json.dump(config, f, indent=2)
+    
+    _config_cache = _build_config(config)
+    _config_key = _stat_config(config_file)
 
 
 def get_config_value(key: str, default: Optional[Any] = None) -> Any:
     """Get a specific configuration value."""
-    config = load_config()
-    return config.get(key, default)
+    return _load_cached_config().get(key, default)
 
 
 def set_config_value(key: str, value: Any) -> None:
@@ -2,7 +2,7 @@
 Node management and operation.
 """
 
-import hashlib
+import json
 import os
 import platform
 import signal
@@ -10,13 +10,45 @@ import sys
 import threading
 import time
 import uuid
-from typing import Callable, Optional
+from concurrent.futures import Future, as_completed
+from typing import Any, Callable, Optional, TypeVar
 
 import psutil
 import requests
+from requests.adapters import HTTPAdapter
 
 from nodie_cli.client import NodieClient, APIError
-from nodie_cli.config import get_config_value, get_pid_file
+from nodie_cli.config import ensure_config_dir, get_config_dir, get_config_value, get_pid_file
+
+# Speed test payload and number of concurrent downloads. httpbin caps its
+# /bytes endpoint at 100 KiB, which is too small to get past slow start.
+_SPEEDTEST_URL = "https://speed.cloudflare.com/__down?bytes=1048576"
+_SPEEDTEST_FLOWS = 4
+
+# (connect, read) timeouts. Connecting should never take long, so a stalled
+# DNS lookup or handshake fails fast instead of holding up the heartbeat.
+_LOOKUP_TIMEOUT = (3.0, 5.0)
+_DOWNLOAD_TIMEOUT = (3.0, 30.0)
+
+T = TypeVar("T")
+
+
+# Executor workers are joined at interpreter exit even after shutdown(), so
+# background work runs on plain daemon threads that never hold up exit.
+def _run_in_background(func: Callable[..., T], *args: Any) -> "Future[T]":
+    """Run func on a daemon thread, completing a Future by hand as an executor would."""
+    future: Future[T] = Future()
+    
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
 class NodieNode:
@@ -24,6 +56,10 @@ class NodieNode:
     
     def __init__(self, client: NodieClient):
         self.client = client
+        # Separate from the API client's session so the auth header is never
+        # sent to the third-party IP and speed test services.
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
         self.device_id = self._get_or_create_device_id()
         self.node_id: Optional[str] = None
         self.is_running = False
@@ -38,21 +74,37 @@ class NodieNode:
         self._heartbeat_thread: Optional[threading.Thread] = None
         self._on_stats_update: Optional[Callable] = None
         self._on_error: Optional[Callable] = None
+        self._pending_speedtest: Optional[Future[tuple[float, float]]] = None
+        self._ip_cached: Optional[str] = None
+        self._ip_last_check = 0.0
+        self._ip_ttl = 300
+        
+        # Prime psutil's CPU counter so later non-blocking reads return the
+        # usage since the previous call
+        psutil.cpu_percent(interval=None)
     
     def _get_or_create_device_id(self) -> str:
         """Get or create a unique device ID."""
-        from nodie_cli.config import get_config_dir
-        
         device_file = get_config_dir() / "device_id"
         
         if device_file.exists():
             return device_file.read_text().strip()
         
-        # Generate device ID based on machine info
+        # Generate device ID based on machine info. This is an identifier, not
+        # a security boundary, so the faster blake2b is used over SHA-256.
+        from hashlib import blake2b
+        
         machine_info = f"{platform.node()}-{platform.machine()}-{uuid.getnode()}"
-        device_id = f"cli_{hashlib.sha256(machine_info.encode()).hexdigest()[:24]}"
+        device_id = f"cli_{blake2b(machine_info.encode(), digest_size=12).hexdigest()}"
         
-        device_file.write_text(device_id)
+        # Create the file exclusively so that if another process got there
+        # first, its ID is kept rather than overwritten
+        try:
+            fd = os.open(device_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            return device_file.read_text().strip() or device_id
+        with os.fdopen(fd, "w") as f:
+            f.write(device_id)
         return device_id
     
     def _get_public_ip(self) -> Optional[str]:
@@ -62,14 +114,24 @@ class NodieNode:
             "https://api.my-ip.io/v2/ip.json",
         ]
         
-        for service in services:
+        def lookup(service: str) -> Optional[str]:
             try:
-                response = requests.get(service, timeout=10)
+                response = self._http.get(service, timeout=_LOOKUP_TIMEOUT)
                 if response.ok:
-                    data = response.json()
+                    data = json.loads(response.content)
                     return data.get("ip") or data.get("ip_address")
             except Exception:
-                continue
+                pass
+            return None
+        
+        # Query every service at once and take the first answer, so one slow
+        # or unreachable service doesn't hold up the lookup. Don't wait for
+        # the others to finish.
+        futures = [_run_in_background(lookup, service) for service in services]
+        for future in as_completed(futures):
+            ip = future.result()
+            if ip:
+                return ip
         return None
     
     def measure_speed(self) -> tuple[float, float]:
@@ -78,23 +140,31 @@ class NodieNode:
         latency_ms = 100.0
         
         try:
-            # Measure latency
-            ping_times = []
-            for _ in range(3):
-                start = time.time()
-                requests.head("https://www.google.com/favicon.ico", timeout=5)
-                ping_times.append((time.time() - start) * 1000)
+            # Measure latency, sending the pings concurrently
+            def ping() -> float:
+                start = time.perf_counter()
+                self._http.head("https://www.google.com/favicon.ico", timeout=_LOOKUP_TIMEOUT)
+                return (time.perf_counter() - start) * 1000
+            
+            ping_futures = [_run_in_background(ping) for _ in range(3)]
+            ping_times = [future.result() for future in ping_futures]
             latency_ms = min(ping_times)
             
-            # Measure download speed
-            start = time.time()
-            response = requests.get(
-                "https://httpbin.org/bytes/102400",
-                timeout=30,
-            )
-            elapsed = time.time() - start
-            size_mb = len(response.content) / (1024 * 1024)
-            speed_mbps = (size_mb / elapsed) * 8
+            # Measure download speed over several parallel connections so the
+            # result isn't dominated by TCP slow start
+            def download() -> tuple[int, float]:
+                start = time.perf_counter()
+                received = 0
+                with self._http.get(_SPEEDTEST_URL, stream=True, timeout=_DOWNLOAD_TIMEOUT) as response:
+                    for chunk in response.iter_content(65536):
+                        received += len(chunk)
+                return received, time.perf_counter() - start
+            
+            download_futures = [_run_in_background(download) for _ in range(_SPEEDTEST_FLOWS)]
+            results = [future.result() for future in download_futures]
+            total_bytes = sum(received for received, _ in results)
+            elapsed = max(flow_elapsed for _, flow_elapsed in results)
+            speed_mbps = (total_bytes * 8) / (elapsed * 1e6)
             
             # Cap at reasonable values
             speed_mbps = min(max(speed_mbps, 0.1), 1000)
@@ -108,7 +178,7 @@ class NodieNode:
     def _get_system_stats(self) -> tuple[float, float]:
         """Get CPU and memory usage."""
         try:
-            cpu_usage = psutil.cpu_percent(interval=0.1)
+            cpu_usage = psutil.cpu_percent(interval=None)
             memory_usage = psutil.virtual_memory().percent
             return cpu_usage, memory_usage
         except Exception:
@@ -118,28 +188,48 @@ class NodieNode:
         """Main heartbeat loop."""
         interval = get_config_value("heartbeat_interval", 30)
         speedtest_interval = get_config_value("speedtest_interval", 300)
-        last_speedtest = 0
+        last_speedtest = float("-inf")
+        
+        # Bind everything that stays the same for the life of the loop
+        stats = self.stats
+        info = self.node_info
+        send_heartbeat = self.client.send_heartbeat
+        node_id = self.node_id
+        speed_mbps = info.get("speedMbps", 0)
+        latency_ms = info.get("latencyMs", 100)
+        
+        # Heartbeats are scheduled against a fixed deadline so the time spent
+        # doing the work doesn't stretch the interval
+        next_tick = time.monotonic() + interval
         
         while not self._stop_event.is_set():
             try:
-                # Get current IP
-                ip = self._get_public_ip()
+                # Get current IP. It rarely changes, so it is only looked up
+                # again once the cached value expires or a heartbeat fails.
+                now = time.monotonic()
+                if self._ip_cached is None or now - self._ip_last_check > self._ip_ttl:
+                    self._ip_cached = self._get_public_ip()
+                    self._ip_last_check = now
+                ip = self._ip_cached
                 
-                # Measure speed periodically
-                now = time.time()
-                if now - last_speedtest >= speedtest_interval:
-                    speed_mbps, latency_ms = self.measure_speed()
+                # Measure speed periodically. The test runs in the background
+                # and its result is picked up on a later tick, so a slow test
+                # never delays a heartbeat.
+                pending = self._pending_speedtest
+                if pending is not None:
+                    if pending.done():
+                        speed_mbps, latency_ms = pending.result()
+                        self._pending_speedtest = None
+                elif now - last_speedtest >= speedtest_interval:
+                    self._pending_speedtest = _run_in_background(self.measure_speed)
                     last_speedtest = now
-                else:
-                    speed_mbps = self.node_info.get("speedMbps", 0)
-                    latency_ms = self.node_info.get("latencyMs", 100)
                 
                 # Get system stats
                 cpu_usage, memory_usage = self._get_system_stats()
                 
                 # Send heartbeat
-                result = self.client.send_heartbeat(
-                    node_id=self.node_id,
+                result = send_heartbeat(
+                    node_id=node_id,
                     bandwidth_used=0.1,
                     cpu_usage=cpu_usage,
                     memory_usage=memory_usage,
@@ -149,33 +239,40 @@ class NodieNode:
                 )
                 
                 # Update stats
-                self.stats["uptime_seconds"] += interval
-                self.stats["bandwidth_used"] += 0.1
-                self.stats["points_earned"] += result.get("pointsEarned", 0)
-                self.stats["heartbeats_sent"] += 1
+                stats["uptime_seconds"] += interval
+                stats["bandwidth_used"] += 0.1
+                stats["points_earned"] += result.points_earned
+                stats["heartbeats_sent"] += 1
                 
                 # Update node info
-                self.node_info.update({
-                    "networkScore": result.get("networkScore", 30),
-                    "ipType": result.get("ipType", "unknown"),
-                    "connectionQuality": result.get("connectionQuality", "unknown"),
-                    "speedMbps": speed_mbps,
-                    "latencyMs": latency_ms,
-                    "ip": ip,
-                })
+                info["networkScore"] = result.network_score
+                info["ipType"] = result.ip_type
+                info["connectionQuality"] = result.connection_quality
+                info["speedMbps"] = speed_mbps
+                info["latencyMs"] = latency_ms
+                info["ip"] = ip
                 
                 if self._on_stats_update:
-                    self._on_stats_update(self.stats, self.node_info)
+                    self._on_stats_update(stats, info)
                 
             except APIError as e:
+                self._ip_cached = None
                 if self._on_error:
                     self._on_error(f"Heartbeat failed: {e.message}")
             except Exception as e:
+                self._ip_cached = None
                 if self._on_error:
                     self._on_error(f"Error: {e}")
             
             # Wait for next interval or stop signal
-            self._stop_event.wait(interval)
+            remaining = next_tick - time.monotonic()
+            if remaining < -interval:
+                # Fell more than a whole interval behind; resync rather than
+                # firing a burst of heartbeats to catch up
+                next_tick = time.monotonic() + interval
+                remaining = interval
+            self._stop_event.wait(max(0.0, remaining))
+            next_tick += interval
     
     def start(
         self,
@@ -191,6 +288,8 @@ class NodieNode:
         
         # Get public IP
         ip = self._get_public_ip()
+        self._ip_cached = ip
+        self._ip_last_check = time.monotonic()
         
         # Run initial speed test
         speed_mbps, latency_ms = self.measure_speed()
@@ -212,6 +311,7 @@ class NodieNode:
         }
         
         # Save PID
+        ensure_config_dir()
         pid_file = get_pid_file()
         pid_file.write_text(str(os.getpid()))
         
@@ -237,6 +337,7 @@ class NodieNode:
         # Wait for thread to finish
         if self._heartbeat_thread:
             self._heartbeat_thread.join(timeout=5)
+        self._pending_speedtest = None
         
         # Notify server
         if self.node_id:
@@ -250,32 +351,26 @@ class NodieNode:
         if pid_file.exists():
             pid_file.unlink()
         
+        self._http.close()
         self.is_running = False
     
     @staticmethod
-    def is_node_running() -> bool:
-        """Check if a node is already running."""
-        pid_file = get_pid_file()
-        if not pid_file.exists():
-            return False
-        
+    def _read_pid() -> Optional[int]:
+        """Read the PID recorded in the PID file, if there is one."""
         try:
-            pid = int(pid_file.read_text().strip())
-            return psutil.pid_exists(pid)
+            return int(get_pid_file().read_text().strip())
         except (ValueError, IOError):
-            return False
+            return None
+    
+    @staticmethod
+    def is_node_running() -> bool:
+        """Check if a node is already running."""
+        return NodieNode.get_running_pid() is not None
     
     @staticmethod
     def get_running_pid() -> Optional[int]:
         """Get the PID of the running node."""
-        pid_file = get_pid_file()
-        if not pid_file.exists():
-            return None
-        
-        try:
-            pid = int(pid_file.read_text().strip())
-            if psutil.pid_exists(pid):
-                return pid
-        except (ValueError, IOError):
-            pass
+        pid = NodieNode._read_pid()
+        if pid is not None and psutil.pid_exists(pid):
+            return pid
         return None
@@ -6,14 +6,58 @@ import os
 import platform
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# Service definitions are kept pre-encoded and filled in with bytes
+# %-formatting, so writing them skips the text encoder.
+_SYSTEMD_TEMPLATE = b"""[Unit]
+Description=Nodie Node - Decentralized Network Node
+After=network.target
+
+[Service]
+Type=simple
+User=%(user)b
+ExecStart=%(nodie_path)b start --foreground
+Restart=always
+RestartSec=10
+
+[Install]
+WantedBy=multi-user.target
+"""
+
+_LAUNCHD_TEMPLATE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>%(label)b</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>%(nodie_path)b</string>
+        <string>start</string>
+        <string>--foreground</string>
+    </array>
+    <key>RunAtLoad</key>
+    <true/>
+    <key>KeepAlive</key>
+    <true/>
+    <key>StandardOutPath</key>
+    <string>/tmp/nodie.stdout.log</string>
+    <key>StandardErrorPath</key>
+    <string>/tmp/nodie.stderr.log</string>
+</dict>
+</plist>
+"""
 
+
+@lru_cache(maxsize=None)
 def get_python_path() -> str:
     """Get the path to the Python interpreter."""
     return sys.executable
 
 
+@lru_cache(maxsize=None)
 def get_nodie_path() -> str:
     """Get the path to the nodie command."""
     # Try to find nodie in the same directory as Python
@@ -33,25 +77,15 @@ def get_nodie_path() -> str:
 
 def install_systemd_service() -> bool:
     """Install systemd service for Linux."""
-    service_content = f"""[Unit]
-Description=Nodie Node - Decentralized Network Node
-After=network.target
-
-[Service]
-Type=simple
-User={os.getenv('USER', 'root')}
-ExecStart={get_nodie_path()} start --foreground
-Restart=always
-RestartSec=10
-
-[Install]
-WantedBy=multi-user.target
-"""
+    service_content = _SYSTEMD_TEMPLATE % {
+        b"user": os.getenv("USER", "root").encode(),
+        b"nodie_path": get_nodie_path().encode(),
+    }
     
     service_path = Path("/etc/systemd/system/nodie.service")
     
     try:
-        service_path.write_text(service_content)
+        service_path.write_bytes(service_content)
         subprocess.run(["systemctl", "daemon-reload"], check=True)
         print(f"✓ Service installed at {service_path}")
         print("\nTo start the service:")
@@ -70,29 +104,10 @@ def install_launchd_service(user_level: bool = True) -> bool:
     """Install launchd service for macOS."""
     label = "host.nodie.node"
     
-    plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>{label}</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{get_nodie_path()}</string>
-        <string>start</string>
-        <string>--foreground</string>
-    </array>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>KeepAlive</key>
-    <true/>
-    <key>StandardOutPath</key>
-    <string>/tmp/nodie.stdout.log</string>
-    <key>StandardErrorPath</key>
-    <string>/tmp/nodie.stderr.log</string>
-</dict>
-</plist>
-"""
+    plist_content = _LAUNCHD_TEMPLATE % {
+        b"label": label.encode(),
+        b"nodie_path": get_nodie_path().encode(),
+    }
     
     if user_level:
         plist_dir = Path.home() / "Library" / "LaunchAgents"
@@ -103,7 +118,7 @@ def install_launchd_service(user_level: bool = True) -> bool:
     plist_path = plist_dir / f"{label}.plist"
     
     try:
-        plist_path.write_text(plist_content)
+        plist_path.write_bytes(plist_content)
         print(f"✓ Service installed at {plist_path}")
         print("\nTo start the service:")
         print(f"  launchctl load {plist_path}")
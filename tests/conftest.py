@@ -0,0 +1,14 @@
+"""Shared test fixtures."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def temp_config_dir(monkeypatch):
+    """Create a temporary config directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.setenv("NODIE_CONFIG_DIR", tmpdir)
+        yield Path(tmpdir)
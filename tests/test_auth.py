@@ -0,0 +1,110 @@
+"""Tests for credential storage."""
+
+import json
+
+import pytest
+
+from nodie_cli import auth
+
+
+class FakeKeyring:
+    """In-memory keyring that counts reads."""
+    
+    def __init__(self):
+        self.store = {}
+        self.reads = 0
+    
+    def get_password(self, service, username):
+        self.reads += 1
+        return self.store.get((service, username))
+    
+    def set_password(self, service, username, password):
+        self.store[(service, username)] = password
+    
+    def delete_password(self, service, username):
+        self.store.pop((service, username), None)
+
+
+@pytest.fixture
+def fake_keyring(monkeypatch):
+    """Replace the system keyring with an in-memory one."""
+    fake = FakeKeyring()
+    monkeypatch.setattr(auth.keyring, "get_password", fake.get_password)
+    monkeypatch.setattr(auth.keyring, "set_password", fake.set_password)
+    monkeypatch.setattr(auth.keyring, "delete_password", fake.delete_password)
+    auth._invalidate_cache()
+    yield fake
+    auth._invalidate_cache()
+
+
+def test_credentials_read_once(fake_keyring):
+    """Test that repeated lookups only hit the keyring once."""
+    auth.save_credentials("test@example.com", "test_token", "123")
+    
+    assert auth.get_token() == "test_token"
+    assert auth.get_user_info() == ("test@example.com", "123")
+    assert auth.get_credentials()["user_id"] == "123"
+    assert fake_keyring.reads == 0
+    
+    auth._invalidate_cache()
+    assert auth.get_token() == "test_token"
+    assert auth.get_user_info() == ("test@example.com", "123")
+    assert fake_keyring.reads == 1
+
+
+def test_save_invalidates_cache(fake_keyring):
+    """Test that saving new credentials replaces the cached ones."""
+    auth.save_credentials("old@example.com", "old_token", "1")
+    assert auth.get_token() == "old_token"
+    
+    auth.save_credentials("new@example.com", "new_token", "2")
+    assert auth.get_token() == "new_token"
+
+
+def test_clear_invalidates_cache(fake_keyring):
+    """Test that clearing credentials is visible immediately."""
+    auth.save_credentials("test@example.com", "test_token", "123")
+    assert auth.get_token() == "test_token"
+    
+    auth.clear_credentials()
+    assert auth.get_token() is None
+    assert auth.get_credentials() is None
+
+
+def test_stored_format(fake_keyring):
+    """Test that credentials are stored as a separator-joined string."""
+    auth.save_credentials("test@example.com", "test_token", "123")
+    
+    stored = fake_keyring.store[(auth.SERVICE_NAME, auth.USERNAME_KEY)]
+    assert stored == "test@example.com\x1ftest_token\x1f123"
+    
+    auth._invalidate_cache()
+    assert auth.get_credentials() == {
+        "email": "test@example.com",
+        "token": "test_token",
+        "user_id": "123",
+    }
+
+
+def test_email_starting_with_brace(fake_keyring):
+    """Test that an email beginning with "{" isn't mistaken for legacy JSON."""
+    auth.save_credentials("{a}@x.com", "tok", "1")
+    
+    auth._invalidate_cache()
+    assert auth.get_credentials() == {
+        "email": "{a}@x.com",
+        "token": "tok",
+        "user_id": "1",
+    }
+
+
+def test_legacy_json_credentials(fake_keyring):
+    """Test that JSON entries from older versions are still readable."""
+    fake_keyring.store[(auth.SERVICE_NAME, auth.USERNAME_KEY)] = json.dumps({
+        "email": "test@example.com",
+        "token": "test_token",
+        "user_id": "123",
+    })
+    
+    assert auth.get_token() == "test_token"
+    assert auth.get_user_info() == ("test@example.com", "123")
@@ -0,0 +1,35 @@
+"""Tests for the command line interface."""
+
+import pytest
+
+from nodie_cli.cli import coerce_config_value
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("true", True),
+    ("False", False),
+    ("30", 30),
+    ("-5", -5),
+    ("0.5", 0.5),
+    ("-2.75", -2.75),
+    ("1e3", 1000.0),
+])
+def test_coerce_config_value(value, expected):
+    """Test that booleans and numbers are converted."""
+    result = coerce_config_value(value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize("value", [
+    "nan",
+    "inf",
+    "-Infinity",
+    "1e999",
+    "1_000",
+    "https://nodie.host/api",
+    "",
+])
+def test_coerce_config_value_keeps_strings(value):
+    """Test that non-finite and non-decimal values stay strings."""
+    assert coerce_config_value(value) == value
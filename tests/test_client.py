@@ -1,6 +1,7 @@
 """Tests for the API client."""
 
 import pytest
+import requests
 import responses
 
 from nodie_cli.client import NodieClient, APIError
@@ -86,7 +87,9 @@ def test_send_heartbeat(client):
         bandwidth_used=0.1,
         speed_mbps=50.0,
     )
-    assert result["pointsEarned"] == 0.5
+    assert result.points_earned == 0.5
+    assert result.network_score == 85
+    assert result.connection_quality == "unknown"
 
 
 @responses.activate
@@ -104,3 +107,62 @@ def test_connection_error():
         client.get_me()
     
     assert "Connection failed" in str(exc_info.value)
+
+
+@responses.activate
+def test_retry_on_gateway_error(client):
+    """Test that idempotent requests are retried on transient gateway errors."""
+    responses.add(
+        responses.GET,
+        "https://nodie.host/api/auth/me",
+        status=503,
+    )
+    responses.add(
+        responses.GET,
+        "https://nodie.host/api/auth/me",
+        json={"id": "123", "username": "testuser"},
+        status=200,
+    )
+    
+    result = client.get_me()
+    assert result["username"] == "testuser"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_no_retry_on_read_timeout(client):
+    """Test that a request that times out reading the response isn't retried."""
+    responses.add(
+        responses.GET,
+        "https://nodie.host/api/auth/me",
+        body=requests.exceptions.ReadTimeout("timed out"),
+    )
+    responses.add(
+        responses.GET,
+        "https://nodie.host/api/auth/me",
+        json={"id": "123", "username": "testuser"},
+        status=200,
+    )
+    
+    with pytest.raises(APIError):
+        client.get_me()
+    assert len(responses.calls) == 1
+    assert client.session.get_adapter("https://nodie.host").max_retries.read == 0
+
+
+@responses.activate
+def test_non_json_error(client):
+    """Test that error responses without a JSON body keep their status code."""
+    responses.add(
+        responses.GET,
+        "https://nodie.host/api/auth/me",
+        body="Internal Server Error",
+        content_type="text/plain",
+        status=500,
+    )
+    
+    with pytest.raises(APIError) as exc_info:
+        client.get_me()
+    
+    assert exc_info.value.status_code == 500
+    assert "500" in str(exc_info.value)
@@ -2,15 +2,12 @@
 
 import json
 import os
-import tempfile
-from pathlib import Path
-
-import pytest
 
 from nodie_cli.config import (
     DEFAULT_CONFIG,
     get_config_dir,
     get_config_file,
+    get_pid_file,
     load_config,
     save_config,
     get_config_value,
@@ -18,14 +15,6 @@ from nodie_cli.config import (
 )
 
 
-@pytest.fixture
-def temp_config_dir(monkeypatch):
-    """Create a temporary config directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        monkeypatch.setenv("NODIE_CONFIG_DIR", tmpdir)
-        yield Path(tmpdir)
-
-
 def test_get_config_dir(temp_config_dir):
     """Test that config dir is created."""
     config_dir = get_config_dir()
@@ -33,6 +22,15 @@ def test_get_config_dir(temp_config_dir):
     assert config_dir == temp_config_dir
 
 
+def test_pid_file_does_not_create_dir(temp_config_dir, monkeypatch):
+    """Test that resolving the PID file path has no filesystem side effects."""
+    missing_dir = temp_config_dir / "missing"
+    monkeypatch.setenv("NODIE_CONFIG_DIR", str(missing_dir))
+    
+    assert get_pid_file() == missing_dir / "nodie.pid"
+    assert not missing_dir.exists()
+
+
 def test_load_default_config(temp_config_dir):
     """Test loading default config when no file exists."""
     config = load_config()
@@ -75,3 +73,32 @@ def test_env_override(temp_config_dir, monkeypatch):
     
     config = load_config()
     assert config["api_url"] == "https://env.example.com"
+
+
+def test_load_config_returns_copy(temp_config_dir):
+    """Test that mutating a loaded config does not leak into the cache."""
+    config = load_config()
+    config["api_url"] = "https://mutated.example.com"
+    
+    assert load_config()["api_url"] == DEFAULT_CONFIG["api_url"]
+
+
+def test_external_edit_invalidates_cache(temp_config_dir):
+    """Test that edits made outside save_config are picked up."""
+    save_config({"test_key": "old"})
+    assert get_config_value("test_key") == "old"
+    
+    config_file = get_config_file()
+    config_file.write_text(json.dumps({"test_key": "new"}))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    assert get_config_value("test_key") == "new"
+
+
+def test_env_override_after_load(temp_config_dir, monkeypatch):
+    """Test that environment overrides set after a load are picked up."""
+    assert get_config_value("api_url") == DEFAULT_CONFIG["api_url"]
+    
+    monkeypatch.setenv("NODIE_API_URL", "https://env.example.com")
+    assert get_config_value("api_url") == "https://env.example.com"
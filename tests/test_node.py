@@ -0,0 +1,323 @@
+"""Tests for node module."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from nodie_cli import node as node_module
+from nodie_cli.client import APIError, HeartbeatResult
+from nodie_cli.config import get_pid_file
+from nodie_cli.node import NodieNode, _SPEEDTEST_FLOWS
+
+
+class FakeClient:
+    """Client that records heartbeats instead of calling the API."""
+    
+    def __init__(self, wanted=3):
+        self.heartbeats = []
+        self.wanted = wanted
+        self.sent = threading.Event()
+    
+    def send_heartbeat(self, **kwargs):
+        self.heartbeats.append(kwargs)
+        if len(self.heartbeats) >= self.wanted:
+            self.sent.set()
+        return HeartbeatResult(points_earned=1.0)
+
+
+def make_node(monkeypatch, client, config_reads=None, interval=0.01):
+    """Create a node whose loop ticks quickly and never touches the network."""
+    config = {"heartbeat_interval": interval, "speedtest_interval": 300}
+    
+    def get_config_value(key, default=None):
+        if config_reads is not None:
+            config_reads.append(key)
+        return config[key]
+    
+    monkeypatch.setattr(node_module, "get_config_value", get_config_value)
+    
+    node = NodieNode(client)
+    node.node_id = "node-1"
+    node.node_info = {"speedMbps": 42.0, "latencyMs": 12.0}
+    monkeypatch.setattr(node, "_get_public_ip", lambda: "203.0.113.7")
+    monkeypatch.setattr(node, "measure_speed", lambda: (99.0, 5.0))
+    return node
+
+
+def run_heartbeats(node):
+    """Run the heartbeat loop until the client has seen enough heartbeats."""
+    thread = threading.Thread(target=node._heartbeat_loop, daemon=True)
+    thread.start()
+    try:
+        assert node.client.sent.wait(5)
+    finally:
+        node._stop_event.set()
+        thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_device_id_persisted(temp_config_dir):
+    """Test that the device ID is written once and reused."""
+    first = NodieNode(None).device_id
+    second = NodieNode(None).device_id
+    
+    assert first.startswith("cli_")
+    assert second == first
+    assert (temp_config_dir / "device_id").read_text() == first
+
+
+def test_device_id_keeps_concurrent_write(temp_config_dir, monkeypatch):
+    """Test that an ID written by another process first is kept."""
+    device_file = temp_config_dir / "device_id"
+    real_open = os.open
+    
+    def racing_open(path, *args, **kwargs):
+        # Another process creates the file between the exists() check and
+        # the exclusive create
+        if Path(path) == device_file:
+            device_file.write_text("cli_other\n")
+        return real_open(path, *args, **kwargs)
+    
+    monkeypatch.setattr(node_module.os, "open", racing_open)
+    
+    assert NodieNode(None).device_id == "cli_other"
+    assert device_file.read_text() == "cli_other\n"
+
+
+def test_heartbeat_loop_reads_config_once(temp_config_dir, monkeypatch):
+    """Test that the loop reads its settings once, not on every tick."""
+    config_reads = []
+    node = make_node(monkeypatch, FakeClient(), config_reads)
+    
+    run_heartbeats(node)
+    
+    assert sorted(config_reads) == ["heartbeat_interval", "speedtest_interval"]
+    assert all(heartbeat["node_id"] == "node-1" for heartbeat in node.client.heartbeats)
+
+
+class FakeDownload:
+    """Streamed response that yields a fixed number of bytes."""
+    
+    def __init__(self, size):
+        self.size = size
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def iter_content(self, chunk_size):
+        for start in range(0, self.size, chunk_size):
+            yield b"x" * min(chunk_size, self.size - start)
+
+
+def test_measure_speed_combines_flows(temp_config_dir, monkeypatch):
+    """Test that speed is the bytes of every flow over the slowest flow's time."""
+    node = NodieNode(None)
+    
+    # Every probe runs on its own thread and reads the clock twice; each
+    # thread takes the next duration on its first read. The pings all finish
+    # before the downloads start.
+    durations = iter([0.03, 0.02, 0.05, 0.2, 0.5, 0.3, 0.4])
+    lock = threading.Lock()
+    local = threading.local()
+    
+    def perf_counter():
+        if not hasattr(local, "elapsed"):
+            with lock:
+                local.elapsed = next(durations)
+            return 0.0
+        return local.elapsed
+    
+    downloads = []
+    
+    def get(url, stream=False, timeout=None):
+        downloads.append(url)
+        return FakeDownload(1048576)
+    
+    monkeypatch.setattr(node_module.time, "perf_counter", perf_counter)
+    monkeypatch.setattr(node._http, "head", lambda url, timeout=None: None)
+    monkeypatch.setattr(node._http, "get", get)
+    
+    speed_mbps, latency_ms = node.measure_speed()
+    
+    assert len(downloads) == _SPEEDTEST_FLOWS
+    assert latency_ms == pytest.approx(20.0)
+    assert speed_mbps == pytest.approx(_SPEEDTEST_FLOWS * 1048576 * 8 / (0.5 * 1e6))
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class FakeStopEvent:
+    """Stop event that advances the fake clock instead of sleeping."""
+    
+    def __init__(self, clock, ticks):
+        self.clock = clock
+        self.ticks = ticks
+        self.waits = []
+    
+    def is_set(self):
+        return len(self.waits) >= self.ticks
+    
+    def wait(self, timeout):
+        self.waits.append(timeout)
+        self.clock.now += timeout
+        return self.is_set()
+
+
+def test_heartbeat_schedule_keeps_deadline(temp_config_dir, monkeypatch):
+    """Test that work time comes out of the wait, with a resync after falling far behind."""
+    clock = FakeClock()
+    monkeypatch.setattr(node_module.time, "monotonic", clock)
+    
+    client = FakeClient()
+    node = make_node(monkeypatch, client, interval=10)
+    
+    # How long each heartbeat takes. The second falls behind by less than an
+    # interval and is caught up; the fourth falls behind by more and resyncs.
+    work = iter([3, 15, 3, 25, 3])
+    real_send = client.send_heartbeat
+    
+    def send_heartbeat(**kwargs):
+        clock.now += next(work)
+        return real_send(**kwargs)
+    
+    monkeypatch.setattr(client, "send_heartbeat", send_heartbeat)
+    node._stop_event = FakeStopEvent(clock, ticks=5)
+    
+    node._heartbeat_loop()
+    
+    assert node._stop_event.waits == [7, 0, 2, 10, 7]
+
+
+@pytest.mark.parametrize("contents", ["", "\n", "not-a-pid", "12.5"])
+def test_invalid_pid_file(temp_config_dir, contents):
+    """Test that an empty or garbage PID file means no node is running."""
+    get_pid_file().write_text(contents)
+    
+    assert NodieNode._read_pid() is None
+    assert NodieNode.get_running_pid() is None
+    assert not NodieNode.is_node_running()
+
+
+def test_missing_pid_file(temp_config_dir):
+    """Test that a missing PID file means no node is running."""
+    assert NodieNode._read_pid() is None
+    assert not NodieNode.is_node_running()
+
+
+def test_running_pid(temp_config_dir):
+    """Test that the PID of a live process is reported."""
+    get_pid_file().write_text(f"{os.getpid()}\n")
+    
+    assert NodieNode.get_running_pid() == os.getpid()
+    assert NodieNode.is_node_running()
+
+
+def test_pending_speedtest_keeps_last_speed(temp_config_dir, monkeypatch):
+    """Test that heartbeats send the last speed until a background test finishes."""
+    client = FakeClient()
+    node = make_node(monkeypatch, client)
+    
+    release = threading.Event()
+    speedtests = []
+    
+    def measure_speed():
+        speedtests.append(1)
+        release.wait(5)
+        return 99.0, 5.0
+    
+    monkeypatch.setattr(node, "measure_speed", measure_speed)
+    
+    thread = threading.Thread(target=node._heartbeat_loop, daemon=True)
+    thread.start()
+    try:
+        assert client.sent.wait(5)
+        pending = list(client.heartbeats)
+        
+        # Once the test finishes its result goes out on a later heartbeat
+        release.set()
+        deadline = time.monotonic() + 5
+        while client.heartbeats[-1]["speed_mbps"] != 99.0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        node._stop_event.set()
+        release.set()
+        thread.join(5)
+    
+    assert not thread.is_alive()
+    assert len(speedtests) == 1
+    for heartbeat in pending:
+        assert (heartbeat["speed_mbps"], heartbeat["latency_ms"]) == (42.0, 12.0)
+    last = client.heartbeats[-1]
+    assert (last["speed_mbps"], last["latency_ms"]) == (99.0, 5.0)
+
+
+class FakeResponse:
+    """Response carrying a JSON body."""
+    
+    ok = True
+    
+    def __init__(self, content):
+        self.content = content
+
+
+def test_public_ip_takes_first_answer(temp_config_dir, monkeypatch):
+    """Test that a fast IP service answers without waiting on a slow one."""
+    node = NodieNode(None)
+    release = threading.Event()
+    
+    def get(url, timeout=None):
+        if "ipify" in url:
+            release.wait(5)
+            return FakeResponse(b'{"ip": "198.51.100.1"}')
+        return FakeResponse(b'{"ip_address": "203.0.113.7"}')
+    
+    monkeypatch.setattr(node._http, "get", get)
+    
+    start = time.monotonic()
+    try:
+        assert node._get_public_ip() == "203.0.113.7"
+        assert time.monotonic() - start < 2
+    finally:
+        release.set()
+
+
+def test_heartbeat_loop_caches_ip(temp_config_dir, monkeypatch):
+    """Test that the IP is looked up once, and again only after a failed heartbeat."""
+    client = FakeClient(wanted=5)
+    node = make_node(monkeypatch, client)
+    
+    lookups = []
+    
+    def get_public_ip():
+        lookups.append(1)
+        return "203.0.113.7"
+    
+    real_send = client.send_heartbeat
+    
+    def send_heartbeat(**kwargs):
+        result = real_send(**kwargs)
+        if len(client.heartbeats) == 3:
+            raise APIError("Bad gateway", 502)
+        return result
+    
+    monkeypatch.setattr(node, "_get_public_ip", get_public_ip)
+    monkeypatch.setattr(client, "send_heartbeat", send_heartbeat)
+    
+    run_heartbeats(node)
+    
+    assert len(lookups) == 2
+    assert all(heartbeat["ip"] == "203.0.113.7" for heartbeat in client.heartbeats)